@@ -7,6 +7,15 @@ class GetResults:
     def __init__(self):
         pass
 
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def reset(self):
+        pass
+
     def open_google(self):
         pass
 
@@ -21,6 +30,9 @@ class GetResults:
 
     def run(self):
         pass
+
+    def search_batch(self, queries, max_results=10, max_concurrency=4):
+        pass
         
 if __name__ == "__main__":
     proxy = MinimalClient(GetResults, host="localhost", port=4444)
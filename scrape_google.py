@@ -8,27 +8,220 @@ Usage:
 Notes:
 - This is intentionally minimal: it always uses the direct /search URL.
 - Headless mode is fully supported with proper configuration.
-- Requires: pip install setuptools undetected-chromedriver selenium beautifulsoup4
+- Requires: pip install setuptools undetected-chromedriver selenium beautifulsoup4 lxml
+- Optional: pip install selectolax (much faster result parsing)
+- Optional: pip install "httpx[http2]" (--engine http/auto: plain HTTP fetch instead of Chrome)
+- Optional: pip install orjson (faster JSON output)
 """
-from dataclasses import dataclass, asdict
-from urllib.parse import urlencode, quote_plus, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urlencode, quote_plus, parse_qs
 import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
+import queue
+import re
 import shutil
+import sqlite3
 import tempfile
+import threading
 import time
 
 import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # Fall back to BeautifulSoup when selectolax is not installed
+    LexborHTMLParser = None
 
-@dataclass
+try:
+    import httpx
+except ImportError:
+    # Only the selenium engine is available
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    # Standard library json is used for output instead
+    orjson = None
+
+
+# Only the results container is materialized when parsing the SERP
+SEARCH_STRAINER = SoupStrainer("div", id="search")
+
+# Result containers, with a fallback to generic .g blocks
+_CANDIDATES_CSS = "div.MjjYud, div.g"
+# First node that signals results are rendered (candidates inside div#search)
+RESULT_READY_CSS = "div#search div.MjjYud, div#search div.g"
+# Snippet: common classes used by Google
+_SNIPPET_CSS = ".IsZvec, .VwiC3b, span.aCOpRe, .s3v9rd, .st"
+
+_SEARCH_URL_PREFIX = "https://www.google.com/search?"
+# Empty 204 response, used to open the connection to Google before the first query
+_WARMUP_URL = "https://www.google.com/generate_204"
+
+# Search engines: Chrome only, plain HTTP only, or HTTP first with Chrome as fallback
+ENGINES = ("selenium", "http", "auto")
+# In auto mode a slow HTTP fetch is abandoned quickly in favour of Chrome
+_HTTP_AUTO_TIMEOUT = 1.5
+
+# Headers for the HTTP engine; Google serves a different page to unknown clients
+_HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+# Host part of an absolute http(s) URL; much cheaper than urlparse() per result
+_DOMAIN_RE = re.compile(r"^https?://([^/?#]+)", re.ASCII | re.IGNORECASE)
+
+
+def _domain_of(url: str) -> str:
+    """
+    Return the host of an absolute http(s) URL, or "" for anything else.
+    """
+    m = _DOMAIN_RE.match(url)
+    return m.group(1) if m else ""
+
+
+def _result_url(href: str) -> str:
+    """
+    Unwrap Google's /url?q=<target> redirect links; other hrefs are returned as-is.
+    
+    JS-page wrappers carry an empty q and the target in url instead.
+    """
+    if href.startswith("/url?"):
+        params = parse_qs(href[5:])
+        target = params.get("q") or params.get("url")
+        return target[0] if target else href
+    return href
+
+
+def _search_fragment(html: str) -> str:
+    """
+    Cut html down to the div#search container before parsing.
+    
+    Everything after the footer (inline scripts, tracking markup) is dropped;
+    if the container is not found the whole document is returned.
+    """
+    i = html.find('<div id="search"')
+    if i < 0:
+        return html
+    j = html.find('<div id="footcnt"', i)
+    return html[i:j] if j > i else html[i:]
+
+
+# In-browser extractor: same rules as the HTML parsers below, run on the live DOM.
+# Arguments: max_results, candidate selector, snippet selector.
+_EXTRACT_JS = """
+var max = arguments[0], candCss = arguments[1], snippetCss = arguments[2];
+var root = document.getElementById("search") || document;
+var cands = root.querySelectorAll(candCss);
+var out = [];
+for (var i = 0; i < cands.length && out.length < max; i++) {
+    var c = cands[i];
+    var a = c.querySelector("a"), h3 = c.querySelector("h3");
+    if (!a || !h3) {
+        var main = c.querySelector("div.yuRUbf a");
+        if (main) { a = main; h3 = main.querySelector("h3"); }
+    }
+    if (!a || !h3) continue;
+    var sn = c.querySelector(snippetCss);
+    out.push({
+        url: a.getAttribute("href") || "",
+        title: h3.textContent.trim(),
+        snippet: sn ? sn.textContent.replace(/\\s+/g, " ").trim() : ""
+    });
+}
+return out;
+"""
+
+# outerHTML of div#search (whole document if missing) in a single WebDriver call
+SEARCH_HTML_JS = (
+    "var e = document.getElementById('search');"
+    "return e ? e.outerHTML : document.documentElement.outerHTML;"
+)
+
+# Find, check visibility of and click Google's consent button in one WebDriver call
+ACCEPT_COOKIES_JS = """
+var b = document.getElementById("L2AGLb");
+if (b && b.offsetParent !== null && !b.disabled) { b.click(); return true; }
+return false;
+"""
+
+# Candidate selector for the BeautifulSoup path, compiled once instead of per select() call
+_SEL_CANDIDATES = sv.compile(_CANDIDATES_CSS)
+
+# _SNIPPET_CSS as class sets, for the single-pass BeautifulSoup scan
+_SNIPPET_CLASSES = frozenset({"IsZvec", "VwiC3b", "s3v9rd", "st"})
+_SNIPPET_SPAN_CLASSES = frozenset({"aCOpRe"})
+
+
+def _scan_candidate(cand):
+    """
+    Find the first link, title and snippet element of a result in one walk.
+    
+    Equivalent to select_one("a"), select_one("h3") and select_one(_SNIPPET_CSS)
+    on the candidate, but traverses its subtree once and stops early.
+    
+    Returns:
+        tuple: (a, h3, snippet) Tags, each None if not found
+    """
+    a = h3 = sn = None
+    for el in cand.descendants:
+        name = el.name
+        if name is None:
+            continue  # text node
+        if name == "a":
+            if a is None:
+                a = el
+        elif name == "h3":
+            if h3 is None:
+                h3 = el
+        if sn is None:
+            classes = el.get("class")
+            if classes and (not _SNIPPET_CLASSES.isdisjoint(classes)
+                            or (name == "span" and not _SNIPPET_SPAN_CLASSES.isdisjoint(classes))):
+                sn = el
+        if a is not None and h3 is not None and sn is not None:
+            break
+    return a, h3, sn
+
+
+# Persistent Chrome profile so cache and cookies survive between runs
+DEFAULT_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".uc_scraper_profile")
+DISK_CACHE_SIZE = 100 * 1024 * 1024
+# Google's consent cookies; kept across resets so the dialog is not shown again
+CONSENT_COOKIES = ("SOCS", "CONSENT")
+
+# Parsed results of earlier searches, reused while fresh
+DEFAULT_RESULT_CACHE = os.path.join(os.path.expanduser("~"), ".uc_scraper_results.sqlite")
+DEFAULT_RESULT_CACHE_TTL = 3600
+
+# Telemetry hosts the SERP pulls in but the scraper never needs
+_BLOCKED_HOSTS = ("www.googletagmanager.com", "www.google-analytics.com")
+
+# Resources blocked via CDP: results are read from the DOM, never rendered
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.css", "*/gen_204*",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     rank: int
     title: str
@@ -36,6 +229,293 @@ class SearchResult:
     url: str
     domain: str
 
+    def to_dict(self):
+        """
+        Flat dict for JSON output (cheaper than dataclasses.asdict).
+        """
+        return {
+            "rank": self.rank,
+            "title": self.title,
+            "snippet": self.snippet,
+            "url": self.url,
+            "domain": self.domain,
+        }
+
+
+class ResultCache:
+    """
+    On-disk SQLite cache of parsed search results.
+    
+    Entries are keyed by (query, lang, max_results) and expire after ttl
+    seconds, so repeated queries skip both the browser and HTML parsing.
+    
+    Attributes:
+        path (str): SQLite database file
+        ttl (int): Lifetime of an entry in seconds
+    """
+    
+    def __init__(self, path: str = None, ttl: int = DEFAULT_RESULT_CACHE_TTL):
+        self.path = path or DEFAULT_RESULT_CACHE
+        self.ttl = ttl
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+
+    def _connect(self):
+        # Short-lived connections keep the cache usable from DriverPool threads
+        return sqlite3.connect(self.path, timeout=5)
+
+    @staticmethod
+    def _key(query: str, lang: str, max_results: int) -> str:
+        return hashlib.blake2b(f"{query}|{lang}|{max_results}".encode(), digest_size=16).hexdigest()
+
+    def get(self, query: str, lang: str, max_results: int):
+        """
+        Return cached results, or None if missing or expired.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT created, payload FROM results WHERE key = ?",
+                (self._key(query, lang, max_results),)
+            ).fetchone()
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return [SearchResult(**item) for item in json.loads(row[1])]
+
+    def put(self, query: str, lang: str, max_results: int, results):
+        """
+        Store results for a query, replacing any older entry.
+        Expired entries are deleted in the same transaction.
+        """
+        payload = json.dumps([r.to_dict() for r in results], ensure_ascii=False)
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM results WHERE created < ?", (now - self.ttl,))
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, created, payload) VALUES (?, ?, ?)",
+                (self._key(query, lang, max_results), now, payload)
+            )
+
+
+@lru_cache(maxsize=None)
+def _chrome_arguments(headless: bool, lang: str, profile_dir: str) -> tuple:
+    """
+    Chrome command-line switches, built once per configuration.
+    """
+    args = [
+        # Skip first-run dialogs and background services
+        "--no-first-run",
+        "--no-service-autorun",
+        "--password-store=basic",
+        
+        # Reuse one profile so Chrome skips first-run setup and keeps its cache
+        f"--user-data-dir={profile_dir}",
+        # Keep Google's static JS/CSS bundles in the profile's disk cache between runs
+        f"--disk-cache-size={DISK_CACHE_SIZE}",
+        
+        # Skip downloads the scraper never reads: images and telemetry
+        "--blink-settings=imagesEnabled=false",
+        "--host-resolver-rules=" + ", ".join(f"MAP {h} ~NOTFOUND" for h in _BLOCKED_HOSTS),
+        
+        # Essential anti-detection measures
+        "--disable-blink-features=AutomationControlled",
+        
+        # Sandboxing and stability settings
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+    ]
+    
+    if lang:
+        # Basic language and locale settings
+        args.append(f"--lang={lang}")
+    
+    if headless:
+        args += [
+            # Modern headless mode (Chrome 96+)
+            "--headless=new",
+            
+            # GPU and rendering settings for headless
+            "--disable-gpu",
+            "--disable-software-rasterizer",
+            
+            # Set explicit window size for consistent rendering
+            "--window-size=1920,1080",
+            
+            # Disable unnecessary features in headless mode
+            "--disable-extensions",
+            "--disable-logging",
+            "--disable-notifications",
+            
+            # Additional headless stability options
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-renderer-backgrounding",
+            
+            # Lower memory for scrape-only sessions: one renderer, no JIT, no extras
+            "--renderer-process-limit=1",
+            "--js-flags=--jitless --noexpose_wasm",
+            "--disable-features=Translate,MediaRouter,OptimizationHints,"
+            "InterestFeedContentSuggestions,CalculateNativeWinOcclusion",
+            "--mute-audio",
+        ]
+    
+    return tuple(args)
+
+
+def build_chrome_options(headless: bool = True, lang: str = "en-US", profile_dir: str = None):
+    """
+    Build Chrome options with proper settings for both headless and normal modes.
+    
+    undetected-chromedriver consumes the options object, so every launch
+    needs a fresh one; only the argument list is cached.
+    
+    Args:
+        headless (bool): Run Chrome in headless mode
+        lang (str): Language preference (e.g., "en-US"), None for Chrome's default
+        profile_dir (str): Chrome user-data-dir (default: DEFAULT_PROFILE_DIR)
+        
+    Returns:
+        uc.ChromeOptions: Configured options
+    """
+    opts = uc.ChromeOptions()
+    for arg in _chrome_arguments(headless, lang, profile_dir or DEFAULT_PROFILE_DIR):
+        opts.add_argument(arg)
+    
+    # Return from driver.get() at DOMContentLoaded; results are awaited explicitly
+    opts.page_load_strategy = "eager"
+    
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    }
+    if lang:
+        prefs["intl.accept_languages"] = lang
+    opts.add_experimental_option("prefs", prefs)
+    
+    if headless:
+        logging.info("Configured for headless mode")
+    else:
+        logging.info("Configured for normal (non-headless) mode")
+    
+    return opts
+
+
+def session_alive(driver) -> bool:
+    """
+    Check whether a WebDriver session (possibly None) still responds.
+    """
+    if driver is None or not driver.session_id:
+        return False
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+def reset_session(driver):
+    """
+    Clear cookies and web storage, keeping Google's consent cookies.
+    
+    Args:
+        driver: WebDriver currently on a google.com page
+    """
+    keep = [c for c in driver.get_cookies() if c["name"] in CONSENT_COOKIES]
+    driver.delete_all_cookies()
+    for cookie in keep:
+        driver.add_cookie(cookie)
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        # Storage is not accessible on about:blank / data: pages
+        pass
+
+
+def consent_given(driver) -> bool:
+    """
+    Check whether the current page sees one of Google's consent cookies.
+    """
+    return any(c["name"] in CONSENT_COOKIES for c in driver.get_cookies())
+
+
+def click_consent(driver, timeout: float = 2) -> bool:
+    """
+    Accept Google's consent dialog on the current page.
+    
+    The dialog may sit in an iframe, so the click script is retried per frame.
+    
+    Args:
+        driver: WebDriver currently on a google.com page
+        timeout (float): Seconds to wait for the consent button
+        
+    Returns:
+        bool: True if consent was already given or the button was clicked
+    """
+    if consent_given(driver):
+        return True
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.ID, "L2AGLb"))
+        )
+    except TimeoutException:
+        pass
+    if driver.execute_script(ACCEPT_COOKIES_JS):
+        return True
+    for frame in driver.find_elements(By.TAG_NAME, "iframe"):
+        try:
+            driver.switch_to.frame(frame)
+            if driver.execute_script(ACCEPT_COOKIES_JS):
+                return True
+        finally:
+            driver.switch_to.default_content()
+    return False
+
+
+# Writable chromedriver copy shared by every scraper in this process,
+# keyed by the system driver's (mtime_ns, size) so an upgrade gets a new copy
+_CACHED_DRIVER_PATH = None
+_CACHED_DRIVER_KEY = None
+_DRIVER_COPY_LOCK = threading.Lock()
+
+
+def _cleanup_driver_copy():
+    """
+    Remove the shared chromedriver copy. Registered with atexit.
+    """
+    global _CACHED_DRIVER_PATH, _CACHED_DRIVER_KEY
+    if _CACHED_DRIVER_PATH:
+        driver_dir = os.path.dirname(_CACHED_DRIVER_PATH)
+        if driver_dir.startswith(tempfile.gettempdir()):
+            shutil.rmtree(driver_dir, ignore_errors=True)
+            logging.debug(f"Cleaned up temp driver dir: {driver_dir}")
+    _CACHED_DRIVER_PATH = None
+    _CACHED_DRIVER_KEY = None
+
+
+atexit.register(_cleanup_driver_copy)
+
+
+def _writable_driver_path(system_driver: str) -> str:
+    """
+    Return a writable copy of system_driver, copying it only once per process.
+    """
+    global _CACHED_DRIVER_PATH, _CACHED_DRIVER_KEY
+    st = os.stat(system_driver)
+    key = (st.st_mtime_ns, st.st_size)
+    with _DRIVER_COPY_LOCK:
+        if _CACHED_DRIVER_KEY == key and os.path.exists(_CACHED_DRIVER_PATH):
+            return _CACHED_DRIVER_PATH
+        # System driver changed (or copy vanished): drop the stale copy first
+        _cleanup_driver_copy()
+        temp_dir = tempfile.mkdtemp(prefix="uc_driver_")
+        path = os.path.join(temp_dir, "chromedriver")
+        shutil.copy2(system_driver, path)
+        os.chmod(path, 0o755)
+        _CACHED_DRIVER_PATH, _CACHED_DRIVER_KEY = path, key
+        return path
+
 
 class SimpleGoogleScraper:
     """
@@ -44,86 +524,79 @@ class SimpleGoogleScraper:
     Attributes:
         headless (bool): Whether to run in headless mode
         timeout (int): Timeout for page loads in seconds
-        lang (str): Language preference (e.g., "en-US")
+        lang (str): Language preference (e.g., "en-US"), None for Chrome's default
         driver: Selenium WebDriver instance
         driver_path (str): Path to writable chromedriver executable
+        profile_dir (str): Chrome user-data-dir reused across sessions
+        engine (str): "selenium", "http", or "auto" (HTTP first, Chrome if blocked)
+        cache (ResultCache): Optional cache of parsed results
+    
+    The scraper can be used as a context manager; one driver then serves
+    every search() call made inside the block.
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 10, lang: str = "en-US"):
+    def __init__(self, headless: bool = True, timeout: int = 10, lang: str = "en-US",
+                 profile_dir: str = None, engine: str = "selenium",
+                 cache: ResultCache = None):
         self.headless = headless
         self.timeout = timeout
         self.lang = lang
+        # hl/gl search parameters derived from lang once, reused by every query
+        lang_parts = lang.split("-") if lang else [None]
+        self._hl = lang_parts[0]
+        self._gl = lang_parts[-1] if len(lang_parts) > 1 else None
+        self.profile_dir = profile_dir or DEFAULT_PROFILE_DIR
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        if engine == "http" and httpx is None:
+            # An explicit http engine means "no browser"; don't quietly launch Chrome
+            raise RuntimeError('--engine http requires httpx (pip install "httpx[http2]")')
+        if engine == "auto" and httpx is None:
+            logging.warning("httpx not installed, using selenium instead of the auto engine")
+            engine = "selenium"
+        self.engine = engine
+        self.cache = cache
         self.driver = None
+        self._http = None
         self.driver_path = None
-        self._setup_driver_path()
-        self.options = self._configure_chrome_options()
+        # Driver copy and options are prepared in start(), only when a browser is needed
+        self.options = None
 
     def _setup_driver_path(self):
         """
         Setup a writable chromedriver path.
         undetected-chromedriver patches the driver binary, so it needs write access.
+        The copy is shared process-wide and removed at interpreter exit.
         """
         # Check if system chromedriver exists
         system_driver = shutil.which("chromedriver")
         if system_driver:
-            # Copy to a writable location
-            temp_dir = tempfile.mkdtemp(prefix="uc_driver_")
-            self.driver_path = os.path.join(temp_dir, "chromedriver")
-            shutil.copy2(system_driver, self.driver_path)
-            os.chmod(self.driver_path, 0o755)
+            # Copy to a writable location (once per process)
+            self.driver_path = _writable_driver_path(system_driver)
             logging.info(f"Using chromedriver from: {self.driver_path}")
         else:
             # Let undetected-chromedriver download it (requires internet)
             self.driver_path = None
             logging.info("System chromedriver not found, will download if needed")
 
-    def _configure_chrome_options(self):
-        """
-        Configure Chrome options with proper settings for both headless and normal modes.
-        """
-        opts = uc.ChromeOptions()
-        
-        # Basic language and locale settings
-        opts.add_argument(f"--lang={self.lang}")
-        
-        # Essential anti-detection measures
-        opts.add_argument("--disable-blink-features=AutomationControlled")
-        
-        # Sandboxing and stability settings
-        opts.add_argument("--no-sandbox")
-        opts.add_argument("--disable-dev-shm-usage")
-        
-        if self.headless:
-            # Modern headless mode (Chrome 96+)
-            opts.add_argument("--headless=new")
-            
-            # GPU and rendering settings for headless
-            opts.add_argument("--disable-gpu")
-            opts.add_argument("--disable-software-rasterizer")
-            
-            # Set explicit window size for consistent rendering
-            opts.add_argument("--window-size=1920,1080")
-            
-            # Disable unnecessary features in headless mode
-            opts.add_argument("--disable-extensions")
-            opts.add_argument("--disable-logging")
-            opts.add_argument("--disable-notifications")
-            
-            # Additional headless stability options
-            opts.add_argument("--disable-background-timer-throttling")
-            opts.add_argument("--disable-backgrounding-occluded-windows")
-            opts.add_argument("--disable-renderer-backgrounding")
-            
-            logging.info("Configured for headless mode")
-        else:
-            logging.info("Configured for normal (non-headless) mode")
-        
-        return opts
+    def __enter__(self):
+        # Chrome is launched by the first search that needs it (not for cache
+        # hits or HTTP engine results) and then kept for the whole block
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
 
     def start(self):
         """
         Start the Chrome WebDriver with proper configuration.
+        No-op if a driver is already running, so callers can start() freely.
         """
+        if self.driver is not None:
+            return
+        self._setup_driver_path()
+        # uc.Chrome consumes its options object, so build a fresh one per launch
+        self.options = build_chrome_options(self.headless, self.lang, self.profile_dir)
         try:
             if self.driver_path:
                 # Use local chromedriver
@@ -143,14 +616,52 @@ class SimpleGoogleScraper:
                 size = self.driver.get_window_size()
                 logging.info(f"Window size: {size['width']}x{size['height']}")
                 
+                # Results are awaited explicitly, so page loads should not block on onload
+                strategy = self.driver.capabilities.get("pageLoadStrategy")
+                if strategy != "eager":
+                    logging.warning(f"Expected eager page loading, driver reports: {strategy}")
+                else:
+                    logging.debug("Page load strategy: eager")
+                
+                self._block_resources()
+                self._warm_up()
+                
         except Exception as e:
             logging.error(f"Failed to start WebDriver: {e}")
             raise
 
+    def _block_resources(self):
+        """
+        Block image, font, stylesheet and beacon requests for this session via CDP.
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
+            logging.debug(f"Blocking {len(_BLOCKED_URL_PATTERNS)} resource URL patterns")
+        except WebDriverException as e:
+            # Not fatal: pages just load slower
+            logging.warning(f"Could not set up resource blocking: {e}")
+
+    def _warm_up(self):
+        """
+        Load an empty 204 page so DNS, TCP and TLS to www.google.com are set up
+        during start() instead of on the first search.
+        """
+        try:
+            self.driver.get(_WARMUP_URL)
+            logging.debug("Connection to www.google.com warmed up")
+        except WebDriverException as e:
+            # Not fatal: the first search just pays the handshake
+            logging.warning(f"Connection warm-up failed: {e}")
+
     def stop(self):
         """
-        Clean up WebDriver and temporary files.
+        Clean up the WebDriver. Safe to call more than once.
+        The shared chromedriver copy outlives the scraper; atexit removes it.
         """
+        if self._http is not None:
+            self._http.close()
+            self._http = None
         try:
             if self.driver:
                 try:
@@ -160,16 +671,35 @@ class SimpleGoogleScraper:
                     logging.warning(f"Error closing driver: {e}")
         finally:
             self.driver = None
-            
-            # Clean up temporary driver directory
-            if self.driver_path and os.path.exists(self.driver_path):
-                try:
-                    driver_dir = os.path.dirname(self.driver_path)
-                    if driver_dir.startswith(tempfile.gettempdir()):
-                        shutil.rmtree(driver_dir, ignore_errors=True)
-                        logging.debug(f"Cleaned up temp driver dir: {driver_dir}")
-                except Exception as e:
-                    logging.debug(f"Failed to clean up temp driver: {e}")
+
+    def reset(self):
+        """
+        Clear cookies and web storage so the next query starts from a clean session.
+        Consent cookies are kept.
+        """
+        if self.driver is None:
+            return
+        reset_session(self.driver)
+
+    def ensure_consent(self):
+        """
+        Accept Google's consent dialog once for this profile.
+        
+        Searches load /search directly and never see the dialog's button, so
+        a fresh profile in a consent region would only get the interstitial.
+        No-op once the profile holds a consent cookie.
+        """
+        try:
+            if consent_given(self.driver):
+                return
+            self.driver.get("https://www.google.com")
+            if click_consent(self.driver):
+                logging.info("Consent dialog accepted")
+            else:
+                logging.debug("No consent dialog found")
+        except WebDriverException as e:
+            # Not fatal: searches may still work outside consent regions
+            logging.warning(f"Could not accept consent dialog: {e}")
 
     def _direct_search_url(self, query: str) -> str:
         """
@@ -181,57 +711,233 @@ class SimpleGoogleScraper:
         Returns:
             str: Complete Google search URL
         """
-        params = {"q": query, "hl": self.lang.split("-")[0]}
-        if "-" in self.lang:
-            params["gl"] = self.lang.split("-")[-1]
-        return f"https://www.google.com/search?{urlencode(params, quote_via=quote_plus)}"
+        params = {"q": query}
+        if self._hl:
+            params["hl"] = self._hl
+        if self._gl:
+            params["gl"] = self._gl
+        return _SEARCH_URL_PREFIX + urlencode(params, quote_via=quote_plus)
 
-    def search(self, query: str, max_results: int = 10):
+    def search(self, query: str, max_results: int = 10, bypass_cache: bool = False):
         """
         Perform a Google search and extract results.
         
         Args:
             query (str): Search query
             max_results (int): Maximum number of results to extract
+            bypass_cache (bool): Ignore cached results and search again
             
         Returns:
             list: List of SearchResult objects
         """
+        if self.cache is not None and not bypass_cache:
+            cached = self.cache.get(query, self.lang, max_results)
+            if cached is not None:
+                logging.info(f"Using cached results for: {query}")
+                return cached
+        
+        results = self._search(query, max_results)
+        
+        # Empty pages are usually blocks or layout changes; don't pin them
+        if self.cache is not None and results:
+            self.cache.put(query, self.lang, max_results, results)
+        return results
+
+    def _search(self, query: str, max_results: int):
+        """
+        Search without consulting the result cache.
+        """
         url = self._direct_search_url(query)
         logging.info(f"Searching for: {query}")
         logging.debug(f"URL: {url}")
         
-        self.driver.get(url)
+        if self.engine != "selenium":
+            timeout = _HTTP_AUTO_TIMEOUT if self.engine == "auto" else self.timeout
+            results = self._search_http(url, max_results, timeout)
+            if results or self.engine == "http":
+                logging.info(f"Query handled by http engine: {query}")
+                return results or []
+            logging.info("HTTP fetch unusable, falling back to selenium")
+        
+        # Reuse the warm driver; only launch Chrome if none is running
+        self.start()
+        try:
+            self.driver.get(url)
+        except WebDriverException:
+            if session_alive(self.driver):
+                raise
+            # Browser crashed or was closed: relaunch once and retry
+            logging.warning("WebDriver session lost, restarting")
+            self.stop()
+            self.start()
+            self.driver.get(url)
         
-        # Wait for search results to load
+        # Wait for the first result node the extractor consumes; #main and
+        # even #search appear well before results are rendered
         try:
             WebDriverWait(self.driver, self.timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div#search, div#rso, div#main"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, RESULT_READY_CSS))
             )
             logging.info("Search results loaded")
         except TimeoutException:
-            logging.warning("Timeout waiting for results, allowing extra time")
-            # Allow a short extra wait for slower page loads
-            time.sleep(1.5)
+            logging.warning("Timeout waiting for results, returning what is there")
         
-        return self.extract_results(max_results=max_results)
+        logging.info(f"Query handled by selenium engine: {query}")
+        results = self.extract_results(max_results=max_results)
+        try:
+            self.reset()
+        except WebDriverException as e:
+            # Results are already extracted; a dead session is restarted next query
+            logging.warning(f"Could not reset session: {e}")
+        return results
+
+    def _http_client(self):
+        """
+        Return the shared httpx client, creating it on first use.
+        
+        One client is kept per scraper so TLS/HTTP2 connections are reused.
+        """
+        if self._http is None:
+            headers = {"User-Agent": _HTTP_USER_AGENT}
+            if self.lang:
+                headers["Accept-Language"] = self.lang
+            kwargs = {
+                "headers": headers,
+                "timeout": self.timeout,
+                "follow_redirects": True,
+            }
+            try:
+                self._http = httpx.Client(http2=True, **kwargs)
+            except ImportError:
+                # HTTP/2 needs the optional 'h2' package
+                self._http = httpx.Client(**kwargs)
+        return self._http
+
+    def _search_http(self, url: str, max_results: int, timeout: float):
+        """
+        Fetch a search URL without a browser and parse the results.
+        
+        Args:
+            url (str): Google search URL
+            max_results (int): Maximum number of results to extract
+            timeout (float): Request timeout in seconds
+            
+        Returns:
+            list: List of SearchResult objects, or None if Chrome is needed
+            (consent page, captcha, rate limit or no parsable results)
+        """
+        try:
+            resp = self._http_client().get(url, timeout=timeout)
+        except httpx.HTTPError as e:
+            logging.warning(f"HTTP fetch failed: {e}")
+            return None
+        
+        if (resp.status_code != 200
+                or "consent.google.com" in resp.url.host
+                or 'id="captcha-form"' in resp.text):
+            logging.warning(f"HTTP fetch blocked (status {resp.status_code})")
+            return None
+        
+        results = self.extract_results(max_results=max_results, html=resp.text)
+        if not results:
+            logging.warning("HTTP fetch returned no results")
+            return None
+        return results
 
-    def extract_results(self, max_results: int = 10):
+    def extract_results(self, max_results: int = 10, html: str = None):
         """
-        Extract search results from the current page.
+        Extract search results from the current page, or from given HTML.
         
         Args:
             max_results (int): Maximum number of results to extract
+            html (str): Page HTML to parse instead of the browser's current page
             
         Returns:
             list: List of SearchResult objects
         """
-        html = self.driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
-        search_root = soup.find("div", id="search") or soup
+        if html is not None:
+            results = self._parse_results(html, max_results)
+            logging.info(f"Extracted {len(results)} search results")
+            return results
+        
+        results = self._extract_results_js(max_results)
+        if not results:
+            # Nothing found in the live DOM; parse the serialized page instead
+            logging.debug("In-page extraction returned nothing, parsing page source")
+            results = self._parse_results(self._search_html(), max_results)
+        
+        logging.info(f"Extracted {len(results)} search results")
+        return results
+
+    def _parse_results(self, html: str, max_results: int):
+        """
+        Parse search results from HTML with the fastest available parser.
+        """
+        # HTTP responses and page_source carry the whole page; parse only div#search
+        html = _search_fragment(html)
+        if LexborHTMLParser is not None:
+            return self._parse_results_lexbor(html, max_results)
+        return self._parse_results_bs4(html, max_results)
+
+    def _search_html(self) -> str:
+        """
+        Serialize only the div#search subtree in one script call.
+        
+        Falls back to the whole document if the container is missing or
+        the script fails.
+        
+        Returns:
+            str: HTML of div#search, or of the whole page
+        """
+        try:
+            return self.driver.execute_script(SEARCH_HTML_JS)
+        except WebDriverException as e:
+            logging.debug(f"Subtree serialization failed, using full page source: {e}")
+            return self.driver.page_source
+
+    def _extract_results_js(self, max_results: int):
+        """
+        Extract search results inside the browser with a single script call.
+        
+        Args:
+            max_results (int): Maximum number of results to extract
+            
+        Returns:
+            list: List of SearchResult objects (empty if the script failed)
+        """
+        try:
+            raw = self.driver.execute_script(_EXTRACT_JS, max_results, _CANDIDATES_CSS, _SNIPPET_CSS)
+        except WebDriverException as e:
+            logging.debug(f"In-page extraction failed: {e}")
+            return []
+        
+        results = []
+        for rank, item in enumerate(raw or [], 1):
+            href = _result_url(item["url"])
+            results.append(SearchResult(
+                rank=rank,
+                title=item["title"],
+                snippet=item["snippet"],
+                url=href,
+                domain=_domain_of(href)
+            ))
+        return results
 
-        # Use common result containers; include fallback to generic .g blocks
-        candidates = search_root.select("div.MjjYud, div.g")
+    def _parse_results_lexbor(self, html: str, max_results: int):
+        """
+        Parse search results with selectolax's Lexbor backend.
+        
+        Args:
+            html (str): Page HTML
+            max_results (int): Maximum number of results to extract
+            
+        Returns:
+            list: List of SearchResult objects
+        """
+        tree = LexborHTMLParser(html)
+        search_root = tree.css_first("div#search") or tree.root
+
+        candidates = search_root.css(_CANDIDATES_CSS)
         logging.debug(f"Found {len(candidates)} candidate result containers")
         
         results = []
@@ -241,27 +947,76 @@ class SimpleGoogleScraper:
             if rank > max_results:
                 break
                 
-            a = cand.select_one("a")
-            h3 = cand.select_one("h3")
+            a = cand.css_first("a")
+            h3 = cand.css_first("h3")
             
-            if not a or not h3:
+            if a is None or h3 is None:
                 # Sometimes link/h3 are nested differently; try a more targeted approach
-                main = cand.select_one("div.yuRUbf a")
-                if main:
+                main = cand.css_first("div.yuRUbf a")
+                if main is not None:
                     a = main
-                    h3 = main.select_one("h3")
+                    h3 = main.css_first("h3")
                     
-            if not a or not h3:
+            if a is None or h3 is None:
+                continue
+                
+            href = _result_url(a.attributes.get("href") or "")
+            title = h3.text(strip=True)
+            
+            sn = cand.css_first(_SNIPPET_CSS)
+            snippet = sn.text(separator=" ", strip=True) if sn is not None else ""
+            
+            domain = _domain_of(href)
+            
+            results.append(SearchResult(
+                rank=rank,
+                title=title,
+                snippet=snippet,
+                url=href,
+                domain=domain
+            ))
+            rank += 1
+        
+        return results
+
+    def _parse_results_bs4(self, html: str, max_results: int):
+        """
+        Parse search results with BeautifulSoup (fallback without selectolax).
+        
+        Args:
+            html (str): Page HTML
+            max_results (int): Maximum number of results to extract
+            
+        Returns:
+            list: List of SearchResult objects
+        """
+        search_root = BeautifulSoup(html, "lxml", parse_only=SEARCH_STRAINER)
+        if not search_root.contents:
+            # No div#search on the page (layout change); parse everything
+            search_root = BeautifulSoup(html, "lxml")
+
+        candidates = _SEL_CANDIDATES.select(search_root)
+        logging.debug(f"Found {len(candidates)} candidate result containers")
+        
+        results = []
+        rank = 1
+        
+        for cand in candidates:
+            if rank > max_results:
+                break
+                
+            # A div.yuRUbf link lookup can't succeed where this scan found no
+            # link or title, so one pass covers the other parsers' fallback too
+            a, h3, sn = _scan_candidate(cand)
+            if a is None or h3 is None:
                 continue
                 
-            href = a.get("href", "")
+            href = _result_url(a.get("href", ""))
             title = h3.get_text(strip=True)
             
-            # Extract snippet: common classes used by Google
-            sn = cand.select_one(".IsZvec, .VwiC3b, span.aCOpRe, .s3v9rd, .st")
             snippet = sn.get_text(" ", strip=True) if sn else ""
             
-            domain = urlparse(href).netloc
+            domain = _domain_of(href)
             
             results.append(SearchResult(
                 rank=rank,
@@ -272,10 +1027,130 @@ class SimpleGoogleScraper:
             ))
             rank += 1
         
-        logging.info(f"Extracted {len(results)} search results")
         return results
 
 
+class DriverPool:
+    """
+    Pool of persistent scrapers that serves several queries in parallel.
+    
+    Each scraper owns its own Chrome instance and profile directory (Chrome
+    locks a profile per process). Searches borrow an idle scraper from the
+    queue and hand it back when done.
+    
+    Attributes:
+        size (int): Number of Chrome instances in the pool
+        scrapers (list): All SimpleGoogleScraper instances owned by the pool
+        idle (queue.Queue): Scrapers currently free to take a query
+    """
+    
+    def __init__(self, size: int = None, headless: bool = True, timeout: int = 10,
+                 lang: str = "en-US", profile_dir: str = None, cache: ResultCache = None):
+        self.size = size or max(1, (os.cpu_count() or 2) // 2)
+        base_profile = profile_dir or DEFAULT_PROFILE_DIR
+        self.scrapers = [
+            SimpleGoogleScraper(headless=headless, timeout=timeout, lang=lang,
+                                profile_dir=f"{base_profile}-{i}", cache=cache)
+            for i in range(self.size)
+        ]
+        self.idle = queue.Queue()
+        # Each scraper may sit in the idle queue only once
+        self._started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """
+        Start every scraper in the pool.
+        
+        Drivers are launched one after another: undetected-chromedriver may
+        download and patch a shared binary on first use. No-op if the pool
+        is already started.
+        """
+        if self._started:
+            return
+        try:
+            for scraper in self.scrapers:
+                scraper.start()
+                # Before the scraper takes queries: fresh pool profiles have no consent yet
+                scraper.ensure_consent()
+                self.idle.put(scraper)
+        except Exception:
+            self.stop()
+            raise
+        self._started = True
+        logging.info(f"Driver pool started ({self.size} instances)")
+
+    def stop(self):
+        """
+        Drain the pool and stop every scraper.
+        """
+        self._started = False
+        while not self.idle.empty():
+            self.idle.get_nowait()
+        for scraper in self.scrapers:
+            scraper.stop()
+
+    def search(self, query: str, max_results: int = 10):
+        """
+        Run one search on the next idle scraper, blocking until one is free.
+        
+        Args:
+            query (str): Search query
+            max_results (int): Maximum number of results to extract
+            
+        Returns:
+            list: List of SearchResult objects
+        """
+        scraper = self.idle.get()
+        try:
+            return scraper.search(query, max_results=max_results)
+        finally:
+            self.idle.put(scraper)
+
+    def map(self, queries, max_results: int = 10):
+        """
+        Run several searches concurrently, one worker thread per scraper.
+        
+        Args:
+            queries (iterable): Search queries
+            max_results (int): Maximum number of results per query
+            
+        Returns:
+            list: One list of SearchResult objects per query, in input order
+        """
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(lambda q: self.search(q, max_results), queries))
+
+    async def search_batch(self, queries, max_results: int = 10, max_concurrency: int = None):
+        """
+        Run several searches concurrently from asyncio code.
+        
+        Selenium calls are blocking, so each search runs in a worker thread;
+        the semaphore keeps at most max_concurrency of them in flight.
+        
+        Args:
+            queries (iterable): Search queries
+            max_results (int): Maximum number of results per query
+            max_concurrency (int): Concurrent searches (default and cap: pool size)
+            
+        Returns:
+            list: One list of SearchResult objects per query, in input order
+        """
+        semaphore = asyncio.Semaphore(min(max_concurrency or self.size, self.size))
+
+        async def _one(query):
+            async with semaphore:
+                return await asyncio.to_thread(self.search, query, max_results)
+
+        return await asyncio.gather(*(_one(q) for q in queries))
+
+
 def configure_logging(debug: bool = False):
     """
     Configure logging with appropriate level.
@@ -306,6 +1181,9 @@ Examples:
   # Search in headless mode
   python scrape_google.py --query "python tutorial" --headless --max 5
   
+  # Plain HTTP first, Chrome only when Google blocks it
+  python scrape_google.py --query "python tutorial" --engine auto
+  
   # Debug mode with detailed logging
   python scrape_google.py --query "python tutorial" --headless --debug
         """
@@ -314,21 +1192,33 @@ Examples:
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
     parser.add_argument("--max", type=int, default=10, help="Maximum results to extract (default: 10)")
     parser.add_argument("--lang", type=str, default="en-US", help="Preferred language (e.g. en-US)")
+    parser.add_argument("--profile-dir", type=str, default=None,
+                        help=f"Chrome profile directory (default: {DEFAULT_PROFILE_DIR})")
+    parser.add_argument("--engine", choices=ENGINES, default="selenium",
+                        help="selenium (Chrome), http (plain fetch, needs httpx) or auto "
+                             "(HTTP first, Chrome only if blocked) (default: selenium)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Always search again instead of reusing results cached for {DEFAULT_RESULT_CACHE_TTL}s")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     args = parser.parse_args()
 
     configure_logging(debug=args.debug)
     
     logging.info(f"Starting Google scraper (headless={args.headless})")
-    scraper = SimpleGoogleScraper(headless=args.headless, timeout=10, lang=args.lang)
+    scraper = SimpleGoogleScraper(headless=args.headless, timeout=10, lang=args.lang,
+                                  profile_dir=args.profile_dir, engine=args.engine,
+                                  cache=None if args.no_cache else ResultCache())
     
     try:
-        scraper.start()
-        results = scraper.search(args.query, max_results=args.max)
+        with scraper:
+            results = scraper.search(args.query, max_results=args.max)
         
-        # Output results as JSON
-        out = {"results": [asdict(r) for r in results]}
-        print(json.dumps(out, ensure_ascii=False, indent=2))
+        # Output results as JSON (orjson serializes the dataclasses natively)
+        if orjson is not None:
+            print(orjson.dumps({"results": results}, option=orjson.OPT_INDENT_2).decode())
+        else:
+            out = {"results": [r.to_dict() for r in results]}
+            print(json.dumps(out, ensure_ascii=False, indent=2))
         
         logging.info(f"Search completed successfully ({len(results)} results)")
     except Exception as e:
@@ -337,8 +1227,6 @@ Examples:
             import traceback
             traceback.print_exc()
         raise
-    finally:
-        scraper.stop()
 
 
 if __name__ == "__main__":
@@ -1,65 +1,153 @@
 # server.py
 
 from minimal_server import minimal_server
+from scrape_google import (
+    DEFAULT_PROFILE_DIR, RESULT_READY_CSS, SEARCH_HTML_JS, SEARCH_STRAINER,
+    DriverPool, LexborHTMLParser, build_chrome_options, click_consent, consent_given,
+    reset_session, session_alive,
+)
 
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import asyncio
+from urllib.parse import quote_plus
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
+# Dauerhaftes Chrome-Profil: Cache, HSTS und Consent-Cookies ueberleben Neustarts.
+# Liegt neben dem Profil von scrape_google, nicht im Temp-Verzeichnis, das das OS leeren darf
+PROFILE_DIR = f"{DEFAULT_PROFILE_DIR}-server"
+
+# Selektoren, geteilt von beiden Parsern
+RESULT_CSS = ".MjjYud"
+MAIN_LINK_CSS = "div.yuRUbf"
+PLAIN_SPAN_CSS = "span:not([class]):not([id])"
+
+# Fuer BeautifulSoup einmal vorkompiliert statt bei jedem select()-Aufruf
+SEL_RESULT = sv.compile(RESULT_CSS)
+SEL_MAIN_LINK = sv.compile(MAIN_LINK_CSS)
+SEL_H3 = sv.compile("h3")
+SEL_PLAIN_SPAN = sv.compile(PLAIN_SPAN_CSS)
+SEL_A = sv.compile("a")
+
 class GetResults:
     def __init__(self):
-        self.options = uc.ChromeOptions()
-        self.options.add_argument("--no-first-run --no-service-autorun --password-store=basic")
-        self.driver = uc.Chrome(options=self.options)
-        self.driver.quit()
+        # Ein Browser fuer alle Anfragen; wird in start() einmal gestartet
+        self.driver = None
+        # Browser-Pool fuer search_batch, beim ersten Aufruf gestartet
+        self.pool = None
+
+    def start(self):
+        if self.driver is not None:
+            return
+        # Gleiche Chrome-Optionen wie scrape_google; Sprache bleibt Browser-Standard
+        options = build_chrome_options(headless=False, lang=None, profile_dir=PROFILE_DIR)
+        self.driver = uc.Chrome(options=options)
+
+    def stop(self):
+        if self.pool is not None:
+            self.pool.stop()
+            self.pool = None
+        self._quit_driver()
+
+    def _quit_driver(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        finally:
+            self.driver = None
+
+    def _restart_driver(self):
+        # Nur den Einzel-Browser neu starten; die search_batch-Browser bleiben warm
+        try:
+            self._quit_driver()
+        except WebDriverException:
+            pass  # Browser ist ohnehin schon weg
+        self.start()
+
+    def reset(self):
+        # Cookies und Storage leeren, damit jede Anfrage sauber startet.
+        # Consent-Cookies bleiben, sonst kaeme der Dialog bei jeder Anfrage wieder.
+        if self.driver is None:
+            return
+        reset_session(self.driver)
 
     def open_google(self):
         self.driver.get("https://www.google.com")
-        time.sleep(5)
+        # Warten bis Suchfeld oder Consent-Button da ist, statt fest 5s zu schlafen
+        try:
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#APjFqb, #L2AGLb"))
+            )
+        except TimeoutException:
+            pass  # z.B. consent.google.com oder /sorry: accept_cookies versucht es trotzdem
         self.accept_cookies()
 
     def accept_cookies(self):
-        try:
-            time.sleep(2)
-            consent_button = self.driver.find_element(By.ID, "L2AGLb")
-            consent_button.click()
-        except:
+        # Im dauerhaften Profil wird der Dialog nur einmal bestaetigt (auch in iframes gesucht)
+        if not click_consent(self.driver):
             print("Consent button not found or already accepted.")
 
     def search_query(self, query="zumba"):
-        search_box = self.driver.find_element(By.ID, "APjFqb")
-        search_box.click()
-        for char in query:
-            search_box.send_keys(char)
-            time.sleep(0.3)  # Simulate human typing
-
-        time.sleep(1)
+        # Suchseite direkt aufrufen statt ins Suchfeld zu tippen
+        self.driver.get(f"https://www.google.com/search?q={quote_plus(query)}")
         try:
-            search_button = self.driver.find_element(By.CLASS_NAME, "gNO89b")
-            search_button.click()
-        except:
-            print("Search button not found.")
-
-        time.sleep(3)
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, RESULT_READY_CSS))
+            )
+        except TimeoutException:
+            pass  # extract_results meldet den fehlenden Container
 
     def extract_results(self):
-        html = self.driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
-        search_div = soup.find("div", id="search")
+        # Nur div#search serialisieren statt der ganzen Seite (page_source)
+        html = self.driver.execute_script(SEARCH_HTML_JS)
+        # selectolax (C-Parser) wenn installiert, sonst BeautifulSoup
+        if LexborHTMLParser is not None:
+            return self._extract_results_lexbor(html)
+        return self._extract_results_bs4(html)
 
-        if not search_div:
+    def _extract_results_lexbor(self, html):
+        search_div = LexborHTMLParser(html).css_first("div#search")
+
+        if search_div is None:
+            print("Kein <div id='search'> gefunden.")
+            return
+
+        results_tab = []
+
+        for result in search_div.css(RESULT_CSS):
+            if result.css_first(MAIN_LINK_CSS) is not None:
+                h3 = result.css_first("h3")
+                span = result.css_first(PLAIN_SPAN_CSS)
+                a = result.css_first("a")
+
+                title = [h3.text(strip=True) if h3 is not None else "—"]
+                span = [span.text(strip=True) if span is not None else "—"]
+                a = [a.attributes["href"] if a is not None and "href" in a.attributes else "—"]
+
+                results_tab.append([title, span, a])
+
+        return results_tab
+
+    def _extract_results_bs4(self, html):
+        search_div = BeautifulSoup(html, "lxml", parse_only=SEARCH_STRAINER)
+
+        if not search_div.contents:
             print("Kein <div id='search'> gefunden.")
             return
             
         results_tab = []
 
-        results = search_div.select(".MjjYud")
+        results = SEL_RESULT.select(search_div)
         for result in results:
-            if result.find("div", class_="yuRUbf"):
-                h3 = result.find("h3")
-                span = result.find("span", class_=False, id=False)
-                a = result.find("a")
+            if SEL_MAIN_LINK.select_one(result):
+                h3 = SEL_H3.select_one(result)
+                span = SEL_PLAIN_SPAN.select_one(result)
+                a = SEL_A.select_one(result)
                 
                 title = [h3.get_text(strip=True) if h3 else "—"]
                 span = [span.get_text(strip=True) if span else "—"]
@@ -70,14 +158,47 @@ class GetResults:
         return results_tab
 
     def run(self):
-        self.driver = uc.Chrome()
-        self.open_google()
+        self.start()
+        try:
+            # Startseite nur bis der Consent erteilt ist; danach direkt /search?q=
+            # (get_cookies sieht nur die aktuelle Seite: nach der ersten Anfrage google.com)
+            if not consent_given(self.driver):
+                self.open_google()
+        except WebDriverException:
+            if session_alive(self.driver):
+                raise
+            # Browser abgestuerzt oder geschlossen: einmal neu starten
+            self._restart_driver()
+            self.open_google()
         self.search_query("zumba")
         tab = self.extract_results()
-        self.driver.quit()
+        try:
+            self.reset()
+        except WebDriverException as e:
+            # Ergebnisse sind schon da; ein toter Browser wird bei der naechsten Anfrage neu gestartet
+            print(f"Session konnte nicht zurueckgesetzt werden: {e}")
         return tab
 
+    def search_batch(self, queries, max_results=10, max_concurrency=4):
+        # Browser bleiben zwischen Aufrufen warm; wird mehr Parallelitaet verlangt
+        # als der Pool hat, wird er groesser neu aufgebaut
+        if self.pool is not None and self.pool.size < max_concurrency:
+            self.pool.stop()
+            self.pool = None
+        if self.pool is None:
+            # Sprache wie beim Server-Browser: Browser-Standard
+            self.pool = DriverPool(size=max_concurrency, headless=False, lang=None,
+                                   profile_dir=PROFILE_DIR)
+            self.pool.start()
+        batches = asyncio.run(self.pool.search_batch(queries, max_results, max_concurrency))
+        return [[r.to_dict() for r in results] for results in batches]
+
 if __name__ == "__main__":
     obj = GetResults()
-    # Starte den Server, der Methoden von obj über den Socket zugänglich macht
-    minimal_server(obj, host="localhost", port=4444)
+    # Browser einmal beim Serverstart hochfahren und fuer alle Anfragen wiederverwenden
+    obj.start()
+    try:
+        # Starte den Server, der Methoden von obj über den Socket zugänglich macht
+        minimal_server(obj, host="localhost", port=4444)
+    finally:
+        obj.stop()